@@ -1,5 +1,6 @@
 """Core mirdata classes
 """
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import random
@@ -397,7 +398,9 @@ class MultiTrack(Track):
                 "This MultiTrack has no tracks/track_audio_property. Cannot perform mixing"
             )
 
-    def get_target(self, track_keys, weights=None, average=True, enforce_length=True):
+    def get_target(
+        self, track_keys, weights=None, average=True, enforce_length=True, out=None
+    ):
         """Get target which is a linear mixture of tracks
 
         Args:
@@ -408,22 +411,44 @@ class MultiTrack(Track):
             enforce_length (bool): If True, raises ValueError if the tracks are
                 not the same length. If False, pads audio with zeros to match the length
                 of the longest track
+            out (np.ndarray or None): If given, the target is written into this
+                array, which must have shape (n_channels, n_samples) and a floating
+                point dtype at least as wide as the target's
 
         Returns:
-            np.ndarray: target audio with shape (n_channels, n_samples)
+            np.ndarray: target audio with shape (n_channels, n_samples). Its dtype
+                is the widest floating point dtype of the tracks' audio (at least float32)
 
         Raises:
             ValueError:
                 if sample rates of the tracks are not equal
+                if the tracks do not have the same number of channels
+                if the number of weights does not match the number of tracks
                 if enforce_length=True and lengths are not equal
+                if out does not have the shape of the target or cannot hold its dtype
+            ZeroDivisionError: if average=True and the weights sum to zero
 
         """
         self._check_mixable()
+
+        # index self.tracks on this thread, so it need not be thread-safe
+        tracks = [self.tracks[k] for k in track_keys]
+
+        def load_track_audio(track):
+            return getattr(track, self.track_audio_property)
+
+        # load the tracks' audio concurrently to overlap file reads and decoding
+        if len(tracks) > 1:
+            max_workers = min(len(tracks), (os.cpu_count() or 1) + 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                loaded_audio = list(executor.map(load_track_audio, tracks))
+        else:
+            loaded_audio = [load_track_audio(track) for track in tracks]
+
         signals = []
         lengths = []
         sample_rates = []
-        for k in track_keys:
-            audio, sample_rate = getattr(self.tracks[k], self.track_audio_property)
+        for audio, sample_rate in loaded_audio:
             # ensure all signals are shape (n_channels, n_samples)
             if len(audio.shape) == 1:
                 audio = audio[np.newaxis, :]
@@ -446,19 +471,56 @@ class MultiTrack(Track):
                         track_keys, lengths
                     )
                 )
-            else:
-                # pad signals to the max length
-                signals = [
-                    np.pad(signal, ((0, 0), (0, max_length - signal.shape[1])))
-                    for signal in signals
-                ]
+
+        n_channels = signals[0].shape[0]
+        if any([signal.shape[0] != n_channels for signal in signals]):
+            raise ValueError(
+                "Track's {} audio do not have the same number of channels {}".format(
+                    track_keys, [signal.shape[0] for signal in signals]
+                )
+            )
 
         if weights is None:
             weights = np.ones((len(track_keys),))
+        elif len(weights) != len(track_keys):
+            raise ValueError(
+                "Got {} weights for {} tracks".format(len(weights), len(track_keys))
+            )
+
+        if average and np.sum(weights) == 0:
+            raise ZeroDivisionError("Weights sum to zero, can't be normalized")
 
-        target = np.average(signals, axis=0, weights=weights)
-        if not average:
-            target *= np.sum(weights)
+        # accumulate the weighted signals in place into a single buffer.
+        # shorter signals are implicitly zero-padded to the max length
+        # keep float32 audio in float32 rather than upcasting to float64
+        dtype = np.result_type(np.float32, *signals)
+        if out is None:
+            target = np.zeros((n_channels, max_length), dtype=dtype)
+        elif out.shape != (n_channels, max_length):
+            raise ValueError(
+                "out has shape {}, but the target has shape {}".format(
+                    out.shape, (n_channels, max_length)
+                )
+            )
+        elif not np.issubdtype(out.dtype, np.floating) or not np.can_cast(
+            dtype, out.dtype
+        ):
+            raise ValueError(
+                "out has dtype {}, which cannot hold the target dtype {}".format(
+                    out.dtype, dtype
+                )
+            )
+        else:
+            target = out
+            target.fill(0.0)
+        scratch = np.empty_like(target)
+        for signal, weight in zip(signals, weights):
+            length = signal.shape[1]
+            np.multiply(signal, weight, out=scratch[:, :length])
+            target[:, :length] += scratch[:, :length]
+
+        if average:
+            target /= np.sum(weights)
 
         return target
 
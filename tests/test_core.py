@@ -1,3 +1,5 @@
+import time
+
 import pytest
 import numpy as np
 
@@ -157,6 +159,15 @@ def test_multitrack_mixing():
     assert target5.shape == (2, 100)
     assert np.max(np.abs(target5)) <= 0.6
 
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "b"], weights=[0.5])
+
+    with pytest.raises(ZeroDivisionError):
+        mtrack.get_target(["a", "b"], weights=[0, 0])
+
+    target_sum = mtrack.get_target(["a", "b"], weights=[0, 0], average=False)
+    assert np.all(target_sum == 0)
+
     random_target1, t1, w1 = mtrack.get_random_target(n_tracks=2)
     assert random_target1.shape == (2, 100)
     assert np.max(np.abs(random_target1)) <= 1
@@ -195,6 +206,127 @@ def test_multitrack_mixing():
     assert mix.shape == (2, 100)
 
 
+def test_multitrack_out():
+    audio = {t: np.random.uniform(-1, 1, (2, 100)) for t in ["a", "b", "c"]}
+
+    class TestTrack(core.Track):
+        def __init__(self, key):
+            self.key = key
+
+        @property
+        def f(self):
+            return audio[self.key], 1000
+
+    class TestMultiTrack(core.MultiTrack):
+        def __init__(self, mtrack_id, data_home):
+            self.mtrack_id = mtrack_id
+            self._data_home = data_home
+            self.tracks = {t: TestTrack(t) for t in ["a", "b", "c"]}
+            self.track_audio_property = "f"
+
+    mtrack = TestMultiTrack("test", "foo")
+
+    out = np.full((2, 100), 10.0)
+    target1 = mtrack.get_target(["a", "c"], out=out)
+    assert target1 is out
+    assert np.allclose(target1, mtrack.get_target(["a", "c"]))
+
+    out_stack = np.full((2, 100, 2), 10.0)
+    mtrack.get_target(["b", "c"], weights=[0.5, 0.2], out=out_stack[..., 1])
+    assert np.all(out_stack[..., 0] == 10.0)
+    assert np.allclose(
+        out_stack[..., 1], mtrack.get_target(["b", "c"], weights=[0.5, 0.2])
+    )
+
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "c"], out=np.zeros((2, 99)))
+
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "c"], out=np.zeros((2, 100), dtype=int))
+
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "c"], out=np.zeros((2, 100), dtype=np.float32))
+
+
+def test_multitrack_dtype():
+    # key: (dtype, length)
+    track_specs = {
+        "a": (np.float32, 100),
+        "b": (np.float32, 100),
+        "c": (np.float64, 100),
+        "d": (np.float64, 100),
+        "e": (np.float32, 80),
+    }
+
+    class TestTrack(core.Track):
+        def __init__(self, key):
+            self.key = key
+
+        @property
+        def f(self):
+            dtype, length = track_specs[self.key]
+            return np.random.uniform(-1, 1, (2, length)).astype(dtype), 1000
+
+    class TestMultiTrack(core.MultiTrack):
+        def __init__(self, mtrack_id, data_home):
+            self.mtrack_id = mtrack_id
+            self._data_home = data_home
+            self.tracks = {t: TestTrack(t) for t in track_specs}
+            self.track_audio_property = "f"
+
+    mtrack = TestMultiTrack("test", "foo")
+
+    target1 = mtrack.get_target(["a", "b"])
+    assert target1.dtype == np.float32
+
+    target2 = mtrack.get_target(["a", "b"], weights=[0.5, 0.2], average=False)
+    assert target2.dtype == np.float32
+    assert np.max(np.abs(target2)) <= 0.7
+
+    target3 = mtrack.get_target(["c", "d"])
+    assert target3.dtype == np.float64
+
+    target4 = mtrack.get_target(["a", "c"])
+    assert target4.dtype == np.float64
+
+    target5 = mtrack.get_target(["a", "e"], enforce_length=False)
+    assert target5.dtype == np.float32
+    assert target5.shape == (2, 100)
+    assert np.max(np.abs(target5)) <= 1
+
+    target6 = mtrack.get_target(["c", "e"], enforce_length=False)
+    assert target6.dtype == np.float64
+    assert target6.shape == (2, 100)
+
+
+def test_multitrack_load_order():
+    class TestTrack(core.Track):
+        def __init__(self, key):
+            self.key = key
+
+        @property
+        def f(self):
+            value = {"a": 1.0, "b": 2.0, "c": 3.0}[self.key]
+            # the first tracks take the longest to load
+            time.sleep(0.01 * (4 - value))
+            return np.full((1, 10), value), 1000
+
+    class TestMultiTrack(core.MultiTrack):
+        def __init__(self, mtrack_id, data_home):
+            self.mtrack_id = mtrack_id
+            self._data_home = data_home
+            self.tracks = {t: TestTrack(t) for t in ["a", "b", "c"]}
+            self.track_audio_property = "f"
+
+    mtrack = TestMultiTrack("test", "foo")
+
+    target = mtrack.get_target(["a", "b", "c"], weights=[1, 10, 100], average=False)
+    assert np.allclose(target, 321.0)
+
+    target = mtrack.get_target(["c"], weights=[2], average=False)
+    assert np.allclose(target, 6.0)
+
+
 def test_multitrack_unequal_len():
     class TestTrack(core.Track):
         def __init__(self, key):
@@ -225,6 +357,32 @@ def test_multitrack_unequal_len():
     assert np.max(np.abs(target2)) <= 3
 
 
+def test_multitrack_unequal_channels():
+    class TestTrack(core.Track):
+        def __init__(self, key):
+            self.key = key
+
+        @property
+        def f(self):
+            n_channels = {"a": 1, "b": 2, "c": 3}[self.key]
+            return np.random.uniform(-1, 1, (n_channels, 100)), 1000
+
+    class TestMultiTrack(core.MultiTrack):
+        def __init__(self, mtrack_id, data_home):
+            self.mtrack_id = mtrack_id
+            self._data_home = data_home
+            self.tracks = {t: TestTrack(t) for t in ["a", "b", "c"]}
+            self.track_audio_property = "f"
+
+    mtrack = TestMultiTrack("test", "foo")
+
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "b"])
+
+    with pytest.raises(ValueError):
+        mtrack.get_target(["b", "c"])
+
+
 def test_multitrack_unequal_sr():
     class TestTrack(core.Track):
         def __init__(self, key):